@@ -17,15 +17,105 @@ Usage:
 import re
 import json
 import csv
-from dataclasses import dataclass, asdict
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional
 from pathlib import Path
+from bisect import bisect_right
 from datetime import date
+from functools import lru_cache
+
+try:
+    import orjson  # Optional: faster JSON export
+except ImportError:
+    orjson = None
+
+
+# Patterns used by the parser, compiled once at import
+_SEP = re.compile(r'^---+$', re.MULTILINE)
+# Supported input formats, tried in this order:
+#   ## r(1) - Generic error
+#   | 1 | Generic error | Catchall... |
+#   1. Generic error
+#   r(1) Generic error
+_HDR = re.compile(r'^##\s+r\((?P<code>\d+)\)\s*[-–—]?\s*(?P<name>.+?)$', re.MULTILINE)
+_TABLE = re.compile(r'\|\s*(?P<code>\d+)\s*\|\s*(?P<name>[^|]+?)\s*\|\s*(?P<desc>[^|]+?)\s*\|')
+_NUM = re.compile(r'^\s*(?P<code>\d+)\.\s+(?P<text>.+?)$', re.MULTILINE)
+_SIMPLE = re.compile(r'r\((?P<code>\d+)\)\s*[:-]?\s*(?P<rest>[^\n]+)')
+_NUMCHECK = re.compile(r'^\s*\d+\.')
+_SENTENCE = re.compile(r'^([^.]+\.)')
+# Cross-references like [D] append, [U] 12.5, [R] ranksum
+_REF = re.compile(r'\[([A-Z]+)\]\s+([\d\.]+(?:\s+[a-zA-Z][\w\s-]*)?|[a-zA-Z][\w\s-]+)')
+# Reference cleanup in one pass: normalize whitespace, fix hyphenation
+# artifacts (e.g., "num- list" -> "numlist"), drop trailing punctuation
+_REF_CLEAN = re.compile(r'\s+|(\w+)-\s+(\w+)|[.,;:]+$')
+
+# Escape table for double-quoted string literals (backslash and quote)
+_ESCAPE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+# One OfficialErrorCode entry in the generated Rust source
+_RUST_ENTRY = (
+    '    OfficialErrorCode {{\n'
+    '        code: {code},\n'
+    '        name: "{name}",\n'
+    '        category: "{category}",\n'
+    '        description: "{desc}",\n'
+    '    }},\n'
+)
+
+# Stata's error code grouping as (first, last, label), sorted by first code
+_CATEGORY_RANGES = [
+    (1, 99, "General"),
+    (100, 199, "Syntax/Command"),
+    (300, 399, "Previously stored result"),
+    (400, 499, "Statistical problems"),
+    (500, 599, "Matrix manipulation"),
+    (600, 699, "File I/O"),
+    (700, 799, "Operating system"),
+    (900, 999, "Memory/Resources"),
+    (1000, 1999, "System limits"),
+    (2000, 2999, "Non-errors (continuation)"),
+    (3000, 3999, "Mata runtime"),
+    (4000, 4999, "Class system"),
+    (7100, 7199, "Python runtime"),
+    (9000, 9999, "System failure"),
+]
+_CATEGORY_STARTS = [lo for lo, _, _ in _CATEGORY_RANGES]
+
+
+def _clean_ref(match: re.Match) -> str:
+    """Replacement callback for _REF_CLEAN."""
+    if match.group(1):
+        return match.group(1) + match.group(2)
+    if match.group(0).isspace():
+        return ' '
+    return ''
+
+
+def _mk_ref_key(manual: str, section: str) -> str:
+    """Build a normalized cross-reference key, e.g. "[P] numlist"."""
+    return f"[{manual}] {_REF_CLEAN.sub(_clean_ref, section.strip())}"
+
+
+@lru_cache(maxsize=None)
+def _category(code: int) -> str:
+    """Assign category based on Stata's error code grouping."""
+    i = bisect_right(_CATEGORY_STARTS, code) - 1
+    if i >= 0:
+        lo, hi, label = _CATEGORY_RANGES[i]
+        if lo <= code <= hi:
+            return label
+    return "Other"
 
 
 @dataclass
 class StataErrorCode:
-    """Represents a single Stata error code."""
+    """
+    Represents a single Stata error code.
+
+    Name and description are expected to be whitespace-normalized by the
+    parser; category is assigned from the code range at parse time.
+    """
     code: int
     name: str
     description: str
@@ -33,49 +123,9 @@ class StataErrorCode:
     references: Optional[List[str]] = None  # Cross-references to other manual sections
     stata_version: str = "18"
 
-    def __post_init__(self):
-        # Clean up description (normalize excessive whitespace)
-        self.description = re.sub(r'\s+', ' ', self.description).strip()
-
-        # Clean up name (remove newlines, normalize whitespace)
-        self.name = re.sub(r'\s+', ' ', self.name).strip()
-
-        # Assign category based on code range
-        if self.category is None:
-            self.category = self._assign_category()
-
-    def _assign_category(self) -> str:
-        """Assign category based on Stata's error code grouping."""
-        if 1 <= self.code <= 99:
-            return "General"
-        elif 100 <= self.code <= 199:
-            return "Syntax/Command"
-        elif 300 <= self.code <= 399:
-            return "Previously stored result"
-        elif 400 <= self.code <= 499:
-            return "Statistical problems"
-        elif 500 <= self.code <= 599:
-            return "Matrix manipulation"
-        elif 600 <= self.code <= 699:
-            return "File I/O"
-        elif 700 <= self.code <= 799:
-            return "Operating system"
-        elif 900 <= self.code <= 999:
-            return "Memory/Resources"
-        elif 1000 <= self.code <= 1999:
-            return "System limits"
-        elif 2000 <= self.code <= 2999:
-            return "Non-errors (continuation)"
-        elif 3000 <= self.code <= 3999:
-            return "Mata runtime"
-        elif 4000 <= self.code <= 4999:
-            return "Class system"
-        elif 7100 <= self.code <= 7199:
-            return "Python runtime"
-        elif 9000 <= self.code <= 9999:
-            return "System failure"
-        else:
-            return "Other"
+
+# Field names in declaration order, for building export dicts
+_FIELD_NAMES = tuple(f.name for f in fields(StataErrorCode))
 
 
 def parse_error_codes_markdown(md_path: Path) -> List[StataErrorCode]:
@@ -96,134 +146,93 @@ def parse_error_codes_markdown(md_path: Path) -> List[StataErrorCode]:
     | Code | Name | Description |
     |------|------|-------------|
     | 1    | Generic error | Catchall... |
+
+    Formats are tried in the order header, table, numbered list, simple;
+    the first one with any matches is used. The formats' patterns overlap
+    (table and list items can span lines), so each gets its own scan.
     """
-    with open(md_path) as f:
-        content = f.read()
-
-    errors = []
-
-    # Try parsing as structured markdown (## r(code) format)
-    header_pattern = r'^##\s+r\((\d+)\)\s*[-–—]?\s*(.+?)$'
-    matches = re.finditer(header_pattern, content, re.MULTILINE)
-
-    sections = []
-    for match in matches:
-        code = int(match.group(1))
-        name = match.group(2).strip()
-        start_pos = match.end()
-        sections.append((code, name, start_pos))
-
-    if sections:
-        # Parse header-based format
-        for i, (code, name, start_pos) in enumerate(sections):
-            # Find end of this section (start of next section or EOF)
-            if i + 1 < len(sections):
-                end_pos = sections[i + 1][2]
-            else:
-                end_pos = len(content)
+    content = md_path.read_text(encoding='utf-8')
+
+    # Keyed by code; the first occurrence of a code wins
+    by_code: Dict[int, StataErrorCode] = {}
+
+    matches = list(_HDR.finditer(content))
+    if matches:
+        # Parse header-based format (## r(code) format)
+        # Each section runs until the next header or EOF
+        bounds = [m.start() for m in matches[1:]] + [len(content)]
+        for match, end_pos in zip(matches, bounds):
+            # Remove separator lines, normalize whitespace
+            description = ' '.join(
+                _SEP.sub('', content[match.end():end_pos].strip()).split()
+            )
+
+            code = int(match.group('code'))
+            by_code.setdefault(code, StataErrorCode(
+                code=code,
+                name=' '.join(match.group('name').split()),
+                description=description if description else "No description available",
+                category=_category(code)
+            ))
 
-            description = content[start_pos:end_pos].strip()
+    elif matches := list(_TABLE.finditer(content)):
+        # Parse table format
+        for match in matches:
+            code = int(match.group('code'))
+            by_code.setdefault(code, StataErrorCode(
+                code=code,
+                name=' '.join(match.group('name').split()),
+                description=' '.join(match.group('desc').split()),
+                category=_category(code)
+            ))
 
-            # Remove separator lines
-            description = re.sub(r'^---+$', '', description, flags=re.MULTILINE)
-            description = ' '.join(description.split())
+    elif matches := list(_NUM.finditer(content)):
+        # Numbered list format (e.g., " 1. description here\n 2. another desc")
+        # This is common in Stata Programming Manual appendix
+        bounds = [m.start() for m in matches[1:]] + [len(content)]
+        for match, end_pos in zip(matches, bounds):
+            code = int(match.group('code'))
+            description_first_line = match.group('text').strip()
+
+            # Collect continuation lines (lines that don't start with a number)
+            continuation = content[match.end():end_pos].strip()
+
+            # Combine first line and continuation
+            full_description = description_first_line
+            if continuation and not _NUMCHECK.match(continuation):
+                full_description += ' ' + continuation
+
+            # Extract name (first line only, or first sentence if short)
+            # Clean up excessive whitespace in name extraction
+            name_candidate = ' '.join(description_first_line.split())
+
+            # If name is too long, try to get first sentence
+            if len(name_candidate) > 100:
+                sentence_match = _SENTENCE.match(name_candidate)
+                name = sentence_match.group(1).strip() if sentence_match else name_candidate[:80].rstrip()
+            else:
+                name = name_candidate
 
-            errors.append(StataErrorCode(
-                code=code,
-                name=name,
-                description=description if description else "No description available"
+            # Extract cross-references: [MANUAL] section.subsection.subsubsection
+            # Clean up and deduplicate, keeping first-seen order
+            ref_list = list(dict.fromkeys(
+                _mk_ref_key(manual, section)
+                for manual, section in _REF.findall(full_description)
             ))
 
-    else:
-        # Try parsing as table format
-        table_pattern = r'\|\s*(\d+)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|'
-        for match in re.finditer(table_pattern, content):
-            code = int(match.group(1))
-            name = match.group(2).strip()
-            description = match.group(3).strip()
-
-            errors.append(StataErrorCode(
+            by_code.setdefault(code, StataErrorCode(
                 code=code,
                 name=name,
-                description=description
+                description=' '.join(full_description.split()),
+                category=_category(code),
+                references=ref_list if ref_list else None
             ))
 
-    if not errors:
-        # Try numbered list format (e.g., " 1. description here\n 2. another desc")
-        # This is common in Stata Programming Manual appendix
-        numbered_list_pattern = r'^\s*(\d+)\.\s+(.+?)$'
-        matches = list(re.finditer(numbered_list_pattern, content, re.MULTILINE))
-
-        if matches:
-            for i, match in enumerate(matches):
-                code = int(match.group(1))
-                description_first_line = match.group(2).strip()
-
-                # Collect continuation lines (lines that don't start with a number)
-                start_pos = match.end()
-                if i + 1 < len(matches):
-                    end_pos = matches[i + 1].start()
-                else:
-                    end_pos = len(content)
-
-                continuation = content[start_pos:end_pos].strip()
-
-                # Combine first line and continuation
-                full_description = description_first_line
-                if continuation and not re.match(r'^\s*\d+\.', continuation):
-                    full_description += ' ' + continuation
-
-                # Extract name (first line only, or first sentence if short)
-                # Clean up excessive whitespace in name extraction
-                first_line_clean = re.sub(r'\s+', ' ', description_first_line)
-
-                # Try to get just the error message template (before explanation)
-                # Look for pattern: "message\n    Explanation" or "message. Explanation"
-                name_parts = first_line_clean.split('\n', 1)
-                name_candidate = name_parts[0].strip()
-
-                # If name is too long, try to get first sentence
-                if len(name_candidate) > 100:
-                    sentence_match = re.match(r'^([^.]+\.)', name_candidate)
-                    name = sentence_match.group(1).strip() if sentence_match else name_candidate[:80]
-                else:
-                    name = name_candidate
-
-                # Extract cross-references like [D] append, [U] 12.5, [R] ranksum
-                # Pattern captures: [MANUAL] section.subsection.subsubsection
-                ref_pattern = r'\[([A-Z]+)\]\s+([\d\.]+(?:\s+[a-zA-Z][\w\s-]*)?|[a-zA-Z][\w\s-]+)'
-                references = re.findall(ref_pattern, full_description)
-
-                # Clean up and deduplicate references
-                ref_list = []
-                seen = set()
-                for manual, section in references:
-                    section_clean = section.strip()
-                    # Normalize whitespace (including newlines)
-                    section_clean = re.sub(r'\s+', ' ', section_clean)
-                    # Fix hyphenation artifacts (e.g., "num- list" -> "numlist")
-                    section_clean = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', section_clean)
-                    # Remove trailing punctuation
-                    section_clean = section_clean.rstrip('.,;:')
-
-                    ref_key = f"[{manual}] {section_clean}"
-                    if ref_key not in seen:
-                        ref_list.append(ref_key)
-                        seen.add(ref_key)
-
-                errors.append(StataErrorCode(
-                    code=code,
-                    name=name,
-                    description=full_description,
-                    references=ref_list if ref_list else None
-                ))
-
-    if not errors:
-        # Try simple r(code) pattern without headers
-        simple_pattern = r'r\((\d+)\)\s*[:-]?\s*([^\n]+)'
-        for match in re.finditer(simple_pattern, content):
-            code = int(match.group(1))
-            rest = match.group(2).strip()
+    else:
+        # Simple r(code) pattern without headers
+        for match in _SIMPLE.finditer(content):
+            code = int(match.group('code'))
+            rest = ' '.join(match.group('rest').split())
 
             # Try to split name and description
             if '.' in rest:
@@ -238,81 +247,81 @@ def parse_error_codes_markdown(md_path: Path) -> List[StataErrorCode]:
                 name = rest
                 description = ""
 
-            errors.append(StataErrorCode(
+            by_code.setdefault(code, StataErrorCode(
                 code=code,
                 name=name,
-                description=description if description else name
+                description=description if description else name,
+                category=_category(code)
             ))
 
-    # Sort by code
-    errors.sort(key=lambda e: e.code)
-
-    # Remove duplicates (keep first occurrence)
-    seen_codes = set()
-    unique_errors = []
-    for err in errors:
-        if err.code not in seen_codes:
-            unique_errors.append(err)
-            seen_codes.add(err.code)
-
-    return unique_errors
+    return sorted(by_code.values(), key=lambda e: e.code)
 
 
 def export_to_markdown(errors: List[StataErrorCode], output_path: Path):
     """Export to clean, structured markdown."""
-    with open(output_path, 'w') as f:
-        f.write('# Stata Error Codes Reference\n\n')
-        f.write('Extracted from: Programming Manual (p.pdf), pages 209-223\n')
-        f.write('Stata Version: 18\n')
-        f.write(f'Extraction Date: {date.today()}\n')
-        f.write(f'Total Error Codes: {len(errors)}\n\n')
-        f.write('---\n\n')
-
-        for err in errors:
-            f.write(f'## r({err.code}) - {err.name}\n\n')
-            if err.category:
-                f.write(f'**Category**: {err.category}\n\n')
-            f.write(f'{err.description}\n\n')
-            if err.references:
-                f.write(f'**See also**: {", ".join(err.references)}\n\n')
-            f.write('---\n\n')
+    parts = [
+        '# Stata Error Codes Reference\n\n',
+        'Extracted from: Programming Manual (p.pdf), pages 209-223\n',
+        'Stata Version: 18\n',
+        f'Extraction Date: {date.today()}\n',
+        f'Total Error Codes: {len(errors)}\n\n',
+        '---\n\n',
+    ]
+    append = parts.append
+
+    for err in errors:
+        append(f'## r({err.code}) - {err.name}\n\n')
+        if err.category:
+            append(f'**Category**: {err.category}\n\n')
+        append(f'{err.description}\n\n')
+        if err.references:
+            append(f'**See also**: {", ".join(err.references)}\n\n')
+        append('---\n\n')
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
 
 
 def export_to_toml(errors: List[StataErrorCode], output_path: Path):
     """Export to TOML for Rust inclusion."""
-    with open(output_path, 'w') as f:
-        f.write('# Stata Error Codes - Extracted from p.pdf\n')
-        f.write('# Source: Programming Manual, Appendix (pages 209-223)\n')
-        f.write(f'# Stata Version: 18\n')
-        f.write(f'# Extraction Date: {date.today()}\n')
-        f.write(f'# Total Codes: {len(errors)}\n\n')
-
-        for err in errors:
-            f.write('[[error]]\n')
-            f.write(f'code = {err.code}\n')
-            f.write(f'name = "{err.name}"\n')
-            if err.category:
-                f.write(f'category = "{err.category}"\n')
-
-            # Handle multiline descriptions
-            desc = err.description.replace('"', '\\"')
-            if '\n' in desc or len(desc) > 80:
-                f.write(f'description = """\\\n{desc}\\\n"""\n')
-            else:
-                f.write(f'description = "{desc}"\n')
+    parts = [
+        '# Stata Error Codes - Extracted from p.pdf\n',
+        '# Source: Programming Manual, Appendix (pages 209-223)\n',
+        '# Stata Version: 18\n',
+        f'# Extraction Date: {date.today()}\n',
+        f'# Total Codes: {len(errors)}\n\n',
+    ]
+    append = parts.append
 
-            f.write('\n')
+    for err in errors:
+        append('[[error]]\n')
+        append(f'code = {err.code}\n')
+        append(f'name = "{err.name.translate(_ESCAPE)}"\n')
+        if err.category:
+            append(f'category = "{err.category}"\n')
+
+        # Handle multiline descriptions
+        desc = err.description.translate(_ESCAPE)
+        if '\n' in desc or len(desc) > 80:
+            append(f'description = """\\\n{desc}\\\n"""\n')
+        else:
+            append(f'description = "{desc}"\n')
+
+        append('\n')
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
 
 
 def export_to_json(errors: List[StataErrorCode], output_path: Path):
     """Export to JSON for machine consumption."""
-    # Filter out None values from each error dict
-    errors_clean = []
-    for err in errors:
-        err_dict = asdict(err)
-        # Remove None/null fields
-        err_dict = {k: v for k, v in err_dict.items() if v is not None}
-        errors_clean.append(err_dict)
+    # Build each error dict directly (no nested dataclasses, so asdict's
+    # recursive copy is unnecessary), dropping None/null fields
+    errors_clean = [
+        {name: value for name in _FIELD_NAMES
+         if (value := getattr(err, name)) is not None}
+        for err in errors
+    ]
 
     data = {
         "source": "Stata Programming Manual v18",
@@ -323,69 +332,71 @@ def export_to_json(errors: List[StataErrorCode], output_path: Path):
         "errors": errors_clean
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
 
 def export_to_csv(errors: List[StataErrorCode], output_path: Path):
     """Export to CSV for spreadsheet analysis."""
-    with open(output_path, 'w', newline='') as f:
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(['Code', 'Name', 'Category', 'Description'])
-
-        for err in errors:
-            writer.writerow([
-                err.code,
-                err.name,
-                err.category or '',
-                err.description
-            ])
+        writer.writerows(
+            (err.code, err.name, err.category or '', err.description)
+            for err in errors
+        )
 
 
 def generate_rust_code(errors: List[StataErrorCode], output_path: Path):
     """Generate Rust source code with error code definitions."""
-    with open(output_path, 'w') as f:
-        f.write('// DO NOT EDIT - Generated from external/stata-docs/error-codes.toml\n')
-        f.write('// Source: Stata Programming Manual v18, pages 209-223\n')
-        f.write(f'// Generation Date: {date.today()}\n')
-        f.write(f'// Total Codes: {len(errors)}\n\n')
-
-        f.write('/// Official Stata error code from documentation\n')
-        f.write('#[derive(Debug, Clone)]\n')
-        f.write('pub struct OfficialErrorCode {\n')
-        f.write('    pub code: u32,\n')
-        f.write('    pub name: &\'static str,\n')
-        f.write('    pub category: &\'static str,\n')
-        f.write('    pub description: &\'static str,\n')
-        f.write('}\n\n')
-
-        f.write('/// All official Stata error codes from Programming Manual\n')
-        f.write('pub const OFFICIAL_ERROR_CODES: &[OfficialErrorCode] = &[\n')
-
-        for err in errors:
-            # Escape strings for Rust
-            name = err.name.replace('\\', '\\\\').replace('"', '\\"')
-            desc = err.description.replace('\\', '\\\\').replace('"', '\\"')
-            category = err.category if err.category else "General"
-
-            f.write(f'    OfficialErrorCode {{\n')
-            f.write(f'        code: {err.code},\n')
-            f.write(f'        name: "{name}",\n')
-            f.write(f'        category: "{category}",\n')
-            f.write(f'        description: "{desc}",\n')
-            f.write(f'    }},\n')
-
-        f.write('];\n\n')
-
-        f.write('/// Look up official error code by number\n')
-        f.write('pub fn lookup_official_error(code: u32) -> Option<&\'static OfficialErrorCode> {\n')
-        f.write('    OFFICIAL_ERROR_CODES.iter().find(|e| e.code == code)\n')
-        f.write('}\n\n')
-
-        f.write('/// Get all error codes as a sorted list\n')
-        f.write('pub fn all_error_codes() -> Vec<u32> {\n')
-        f.write('    OFFICIAL_ERROR_CODES.iter().map(|e| e.code).collect()\n')
-        f.write('}\n')
+    parts = [
+        '// DO NOT EDIT - Generated from external/stata-docs/error-codes.toml\n',
+        '// Source: Stata Programming Manual v18, pages 209-223\n',
+        f'// Generation Date: {date.today()}\n',
+        f'// Total Codes: {len(errors)}\n\n',
+
+        '/// Official Stata error code from documentation\n',
+        '#[derive(Debug, Clone)]\n',
+        'pub struct OfficialErrorCode {\n',
+        '    pub code: u32,\n',
+        '    pub name: &\'static str,\n',
+        '    pub category: &\'static str,\n',
+        '    pub description: &\'static str,\n',
+        '}\n\n',
+
+        '/// All official Stata error codes from Programming Manual\n',
+        'pub const OFFICIAL_ERROR_CODES: &[OfficialErrorCode] = &[\n',
+    ]
+    append = parts.append
+
+    for err in errors:
+        append(_RUST_ENTRY.format(
+            code=err.code,
+            name=err.name.translate(_ESCAPE),
+            category=err.category if err.category else "General",
+            desc=err.description.translate(_ESCAPE),
+        ))
+
+    parts.extend([
+        '];\n\n',
+
+        '/// Look up official error code by number\n',
+        'pub fn lookup_official_error(code: u32) -> Option<&\'static OfficialErrorCode> {\n',
+        '    OFFICIAL_ERROR_CODES.iter().find(|e| e.code == code)\n',
+        '}\n\n',
+
+        '/// Get all error codes as a sorted list\n',
+        'pub fn all_error_codes() -> Vec<u32> {\n',
+        '    OFFICIAL_ERROR_CODES.iter().map(|e| e.code).collect()\n',
+        '}\n',
+    ])
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
 
 
 def main():
@@ -428,20 +439,22 @@ def main():
     # Export to all formats
     print('\n📝 Generating outputs:')
 
-    export_to_markdown(errors, clean_md)
-    print(f'  ✅ Markdown: {clean_md}')
-
-    export_to_toml(errors, toml_out)
-    print(f'  ✅ TOML: {toml_out}')
-
-    export_to_json(errors, json_out)
-    print(f'  ✅ JSON: {json_out}')
-
-    export_to_csv(errors, csv_out)
-    print(f'  ✅ CSV: {csv_out}')
-
-    generate_rust_code(errors, rust_out)
-    print(f'  ✅ Rust: {rust_out}')
+    outputs = [
+        ('Markdown', export_to_markdown, clean_md),
+        ('TOML', export_to_toml, toml_out),
+        ('JSON', export_to_json, json_out),
+        ('CSV', export_to_csv, csv_out),
+        ('Rust', generate_rust_code, rust_out),
+    ]
+
+    # Exporters are independent; run them concurrently and report in a
+    # fixed order
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        futures = [executor.submit(export, errors, path) for _, export, path in outputs]
+
+    for (label, _, path), future in zip(outputs, futures):
+        future.result()
+        print(f'  ✅ {label}: {path}')
 
     print('\n🎉 Extraction complete!')
     print(f'\nNext steps:')
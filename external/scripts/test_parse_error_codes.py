@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for parse_error_codes.py format detection.
+
+Usage:
+    python -m unittest external/scripts/test_parse_error_codes.py
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Allow running from the repo root as well as from this directory
+sys.path.insert(0, str(Path(__file__).parent))
+
+from parse_error_codes import parse_error_codes_markdown  # noqa: E402
+
+
+def parse(content: str):
+    with tempfile.TemporaryDirectory() as tmp:
+        md_path = Path(tmp) / 'error-codes-raw.md'
+        md_path.write_text(content, encoding='utf-8')
+        return parse_error_codes_markdown(md_path)
+
+
+class FormatDetectionTest(unittest.TestCase):
+    def test_numbered_item_does_not_swallow_header(self):
+        errors = parse('## r(1) - first\nSee the steps:\n2.\n## r(2) - second\nbody\n')
+        self.assertEqual([e.code for e in errors], [1, 2])
+
+    def test_table_cells_do_not_swallow_header(self):
+        errors = parse('## r(1) - first\nuse a | 5 | b\n## r(2) - second | x |\n')
+        self.assertEqual([e.code for e in errors], [1, 2])
+
+    def test_header_section_ends_at_next_header(self):
+        errors = parse('## r(1) - first\nbody one\n## r(2) - second\nbody two\n')
+        self.assertEqual([e.description for e in errors], ['body one', 'body two'])
+
+    def test_simple_name_on_next_line(self):
+        errors = parse('r(601)\nfile not found\nr(603)\nfile could not be opened\n')
+        self.assertEqual([(e.code, e.name) for e in errors],
+                         [(601, 'file not found'), (603, 'file could not be opened')])
+
+    def test_simple_name_on_same_line(self):
+        errors = parse('r(198) invalid syntax\nr(199) - unrecognized command\n')
+        self.assertEqual([(e.code, e.name) for e in errors],
+                         [(198, 'invalid syntax'), (199, 'unrecognized command')])
+
+
+if __name__ == '__main__':
+    unittest.main()
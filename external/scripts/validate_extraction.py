@@ -15,8 +15,10 @@ Usage:
 
 import json
 import csv
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Tuple
 
 
 # Error codes we MUST have (commonly seen in practice)
@@ -38,13 +40,12 @@ KNOWN_CATEGORIES = {
 
 def load_json(json_path: Path) -> Dict:
     """Load and return JSON error codes."""
-    with open(json_path) as f:
-        return json.load(f)
+    return json.loads(json_path.read_text(encoding='utf-8'))
 
 
 def load_csv(csv_path: Path) -> List[Dict]:
     """Load and return CSV error codes."""
-    with open(csv_path) as f:
+    with open(csv_path, newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         return list(reader)
 
@@ -64,13 +65,7 @@ def check_required_codes(codes: List[int]) -> List[str]:
 def check_duplicates(codes: List[int]) -> List[str]:
     """Check for duplicate error codes."""
     errors = []
-    seen = set()
-    duplicates = set()
-
-    for code in codes:
-        if code in seen:
-            duplicates.add(code)
-        seen.add(code)
+    duplicates = [code for code, n in Counter(codes).items() if n > 1]
 
     if duplicates:
         errors.append(f'❌ Duplicate error codes found: {sorted(duplicates)}')
@@ -81,14 +76,19 @@ def check_duplicates(codes: List[int]) -> List[str]:
 def check_descriptions(error_data: List[Dict]) -> List[str]:
     """Check that all errors have descriptions."""
     errors = []
-    missing = []
+    if not error_data:
+        return errors
 
-    for err in error_data:
-        code = err.get('code') or err.get('Code')
-        desc = err.get('description') or err.get('Description')
+    # Rows are either all JSON-shaped or all CSV-shaped; pick the keys once
+    if 'code' in error_data[0]:
+        code_key, desc_key = 'code', 'description'
+    else:
+        code_key, desc_key = 'Code', 'Description'
 
-        if not desc or desc.strip() == '':
-            missing.append(code)
+    missing = [
+        err[code_key] for err in error_data
+        if not (err.get(desc_key) or '').strip()
+    ]
 
     if missing:
         errors.append(f'❌ Error codes missing descriptions: {missing[:10]}')
@@ -103,11 +103,12 @@ def check_code_ranges(codes: List[int]) -> List[str]:
     warnings = []
     sorted_codes = sorted(codes)
 
-    gaps = []
-    for i in range(len(sorted_codes) - 1):
-        gap = sorted_codes[i + 1] - sorted_codes[i]
-        if gap > 20:  # Large gap might indicate missing codes
-            gaps.append((sorted_codes[i], sorted_codes[i + 1], gap))
+    # Large gap might indicate missing codes
+    gaps = [
+        (a, b, b - a)
+        for a, b in zip(sorted_codes, sorted_codes[1:])
+        if b - a > 20
+    ]
 
     if gaps:
         warnings.append('⚠️  Large gaps in error codes detected:')
@@ -120,13 +121,10 @@ def check_code_ranges(codes: List[int]) -> List[str]:
     return warnings
 
 
-def check_file_consistency(json_path: Path, csv_path: Path) -> List[str]:
+def check_file_consistency(json_data: Dict, csv_data: List[Dict]) -> List[str]:
     """Check that JSON and CSV have the same error codes."""
     errors = []
 
-    json_data = load_json(json_path)
-    csv_data = load_csv(csv_path)
-
     json_codes = {e['code'] for e in json_data['errors']}
     csv_codes = {int(e['Code']) for e in csv_data}
 
@@ -142,21 +140,25 @@ def check_file_consistency(json_path: Path, csv_path: Path) -> List[str]:
     return errors
 
 
-def check_format_validity(json_path: Path, csv_path: Path) -> List[str]:
-    """Check that files are valid JSON/CSV."""
+def load_and_check_format(
+    json_path: Path, csv_path: Path
+) -> Tuple[Optional[Dict], Optional[List[Dict]], List[str]]:
+    """Load both files, checking that they are valid JSON/CSV."""
     errors = []
+    json_data = None
+    csv_data = None
 
     try:
-        load_json(json_path)
+        json_data = load_json(json_path)
     except json.JSONDecodeError as e:
         errors.append(f'❌ Invalid JSON: {e}')
 
     try:
-        load_csv(csv_path)
+        csv_data = load_csv(csv_path)
     except Exception as e:
         errors.append(f'❌ Invalid CSV: {e}')
 
-    return errors
+    return json_data, csv_data, errors
 
 
 def print_summary(json_data: Dict):
@@ -183,8 +185,9 @@ def print_summary(json_data: Dict):
     ]
 
     print('\n  Error codes by range:')
+    sorted_codes = sorted(codes)
     for start, end, label in ranges:
-        count = sum(1 for c in codes if start <= c <= end)
+        count = bisect_right(sorted_codes, end) - bisect_left(sorted_codes, start)
         if count > 0:
             print(f'    r({start:3d})-r({end:3d}) [{label:20s}]: {count:3d} codes')
 
@@ -210,17 +213,13 @@ def main():
 
     print('🔍 Validating extracted error codes...\n')
 
-    # Check format validity first
-    format_errors = check_format_validity(json_path, csv_path)
+    # Load data, checking format validity first
+    json_data, csv_data, format_errors = load_and_check_format(json_path, csv_path)
     if format_errors:
         for err in format_errors:
             print(err)
         return 1
 
-    # Load data
-    json_data = load_json(json_path)
-    csv_data = load_csv(csv_path)
-
     errors = json_data['errors']
     codes = [e['code'] for e in errors]
 
@@ -231,7 +230,7 @@ def main():
     all_errors.extend(check_required_codes(codes))
     all_errors.extend(check_duplicates(codes))
     all_errors.extend(check_descriptions(errors))
-    all_errors.extend(check_file_consistency(json_path, csv_path))
+    all_errors.extend(check_file_consistency(json_data, csv_data))
 
     all_warnings.extend(check_code_ranges(codes))
 